@@ -2,7 +2,12 @@
 """
 
 import argparse
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterator, List, Optional, Union
 
 from src.annotator import TextAnnotator
 from src.dictionary import ECDictSqlite
@@ -42,6 +47,69 @@ span.annotated-word { display: inline; }
 }
 """
 
+# Built once in the parent; forked workers inherit it copy-on-write
+_shared_evaluator: Optional[DifficultyEvaluator] = None
+# Per-process annotator, set up by _init_worker
+_worker_annotator: Optional[TextAnnotator] = None
+
+
+def _init_worker(args: argparse.Namespace) -> None:
+    """Build this process's annotator (SQLite connections can't be shared).
+
+    The parent's evaluator is reused when inherited through fork; spawned
+    workers build their own.
+    """
+    global _worker_annotator
+    difficulty_model = _shared_evaluator
+    if difficulty_model is None:
+        difficulty_model = DifficultyEvaluator(threshold=args.threshold)
+    dictionary_service = ECDictSqlite(
+        args.dict,
+        max_definitions=args.max_defs,
+        include_phonetic=not args.no_phonetic,
+    )
+    _worker_annotator = TextAnnotator(
+        difficulty_model,
+        dictionary_service,
+        wordwise=args.wordwise,
+    )
+
+
+def _process_chapter(html_content: Union[bytes, memoryview]) -> Union[bytes, memoryview]:
+    """Annotate one chapter with this process's annotator."""
+    return _worker_annotator.process_content(html_content)
+
+
+def _annotate_chapters(
+    contents: List[memoryview], args: argparse.Namespace
+) -> Iterator[Union[bytes, memoryview]]:
+    """Annotate chapters in order, across worker processes when jobs > 1.
+
+    Serially, unchanged chapters come back as the view that was passed in.
+    """
+    global _shared_evaluator
+    if args.jobs <= 1 or len(contents) <= 1:
+        _init_worker(args)
+        yield from map(_process_chapter, contents)
+        return
+
+    # Fork so workers share the parent's word sets instead of rebuilding
+    # them; other platforms keep their default (spawn) start method, and
+    # each spawned worker builds its own evaluator in _init_worker
+    mp_context = None
+    if sys.platform == 'linux':
+        mp_context = multiprocessing.get_context('fork')
+        _shared_evaluator = DifficultyEvaluator(threshold=args.threshold)
+
+    with ProcessPoolExecutor(
+        max_workers=min(args.jobs, len(contents)),
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(args,),
+    ) as executor:
+        # Views can't be pickled; send the bytes objects they wrap
+        yield from executor.map(_process_chapter, [view.obj for view in contents])
+
 
 def main() -> None:
     """Process EPUB file and inject annotations for difficult words."""
@@ -90,6 +158,13 @@ def main() -> None:
         dest="wordwise",
         help="Use inline annotations instead of wordwise mode",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes for chapters (default: CPU count)",
+    )
 
     args = parser.parse_args()
 
@@ -97,36 +172,28 @@ def main() -> None:
     output_path: Path = args.output or input_path.with_stem(f"{input_path.stem}_annotated")
 
     print(f"Reading {input_path}...")
-    epub_handler = EpubHandler(input_path)
-
-    print(f"Initializing models (wordfreq & ECDICT: {args.dict})...")
-    difficulty_model = DifficultyEvaluator(threshold=args.threshold)
-    dictionary_service = ECDictSqlite(
-        args.dict,
-        max_definitions=args.max_defs,
-        include_phonetic=not args.no_phonetic,
-    )
-
-    annotator = TextAnnotator(
-        difficulty_model,
-        dictionary_service,
-        wordwise=args.wordwise,
-    )
-
-    print("Processing chapters...")
-    count = 0
-    for item in epub_handler.get_html_items():
-        original_content = item.get_content()
-        new_content = annotator.process_content(original_content)
-        item.set_content(new_content)
-        count += 1
-        print(f"  Processed chapter {count}", end='\r')
-
-    print(f"\nInjecting styles...")
-    epub_handler.add_css(ANNOTATION_CSS)
-
-    print(f"Saving to {output_path}...")
-    epub_handler.save(output_path)
+    with EpubHandler(input_path) as epub_handler:
+        # Raw chapter bytes; item.get_content() would re-render each document
+        chapters = list(epub_handler.get_html_items_mv())
+        items = [item for item, _ in chapters]
+        contents = [view for _, view in chapters]
+
+        print(f"Processing chapters (wordfreq & ECDICT: {args.dict}, jobs: {args.jobs})...")
+        results = _annotate_chapters(contents, args)
+        for count, (item, view, new_content) in enumerate(zip(items, contents, results), start=1):
+            # Workers send back a copy even for chapters they left untouched
+            if new_content is not view and new_content != view:
+                epub_handler.set_item_content(item, new_content)
+            print(f"  Processed chapter {count}", end='\r')
+
+        if epub_handler.modified:
+            print(f"\nInjecting styles...")
+            epub_handler.add_css(ANNOTATION_CSS)
+        else:
+            print("\nNo difficult words found, copying the book unchanged...")
+
+        print(f"Saving to {output_path}...")
+        epub_handler.save(output_path)
     print("Done!")
 
 
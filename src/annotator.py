@@ -1,16 +1,109 @@
 """Core annotation logic: HTML parsing and definition injection."""
 
-from bs4 import BeautifulSoup, NavigableString
-from typing import Union
+import re
+from html import escape
+from html.parser import HTMLParser
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
 
 from src.dictionary import BaseDictionary
 from src.difficulty import DifficultyEvaluator
 
 
+class _ChapterRewriter(HTMLParser):
+    """Re-emits a chapter token by token without building a document tree.
+
+    Markup is echoed as written. Text outside skipped elements is emitted
+    escaped and its position in `out` is recorded in `text_slots`, so the
+    caller can later swap in annotated markup for that slot.
+    """
+
+    # Elements without end tags, never pushed on the open-element stack
+    VOID_TAGS = frozenset([
+        'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+        'link', 'meta', 'param', 'source', 'track', 'wbr',
+    ])
+    # Raw-text elements whose content HTMLParser still unescapes
+    _ESCAPABLE_RAW_TAGS = frozenset(['textarea', 'title'])
+
+    def __init__(self, skip_tags: FrozenSet[str]):
+        """
+        Args:
+            skip_tags: Elements whose text (at any depth) is never annotated.
+        """
+        super().__init__(convert_charrefs=True)
+        self.skip_tags = skip_tags
+        self.out: List[str] = []
+        # (index into out, unescaped text) for annotatable text runs
+        self.text_slots: List[Tuple[int, str]] = []
+        self._open_tags: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        self.out.append(self.get_starttag_text())
+        if tag in self.VOID_TAGS:
+            return
+        self._open_tags.append(tag)
+        if tag in self.skip_tags:
+            self._skip_depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self.out.append(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        self.out.append(f'</{tag}>')
+        if tag not in self._open_tags:
+            return
+        # Close the element and anything left unclosed inside it
+        while True:
+            open_tag = self._open_tags.pop()
+            if open_tag in self.skip_tags:
+                self._skip_depth -= 1
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if self.cdata_elem and self.cdata_elem not in self._ESCAPABLE_RAW_TAGS:
+            # script/style content is passed through as written
+            self.out.append(data)
+            return
+        if not self._skip_depth:
+            self.text_slots.append((len(self.out), data))
+        self.out.append(escape(data, quote=False))
+
+    def handle_comment(self, data):
+        self.out.append(f'<!--{data}-->')
+
+    def handle_decl(self, decl):
+        self.out.append(f'<!{decl}>')
+
+    def handle_pi(self, data):
+        self.out.append(f'<?{data}>')
+
+    def unknown_decl(self, data):
+        # Marked sections: <![CDATA[...]]> or <![if ...]>
+        terminator = ']]>' if data.startswith('CDATA[') else ']>'
+        self.out.append(f'<![{data}{terminator}')
+
+
 class TextAnnotator:
     """Processes HTML content to inject word annotations."""
 
-    SKIP_TAGS = frozenset(['script', 'style', 'pre'])
+    SKIP_TAGS = frozenset(['script', 'style', 'pre', 'title', 'rt', 'rp'])
+    # Cheap pre-check: text without a 3+ letter run holds no candidate words
+    _HAS_CANDIDATE = re.compile(r'[A-Za-z]{3,}')
+    # Chapter-level pre-check on raw bytes: 6+ letter runs stand in for
+    # rare-word candidates; chapters with fewer are left untouched
+    _LONG_WORD_BYTES = re.compile(rb'[A-Za-z]{6,}')
+    _MIN_LONG_WORDS = 20
+
+    WORDWISE_TEMPLATE = (
+        '<ruby class="annotated-word wordwise">{word}'
+        '<rt class="annotation">{definition}</rt></ruby>'
+    )
+    INLINE_TEMPLATE = (
+        '<span class="annotated-word">{word}'
+        '<span class="annotation"> ({definition})</span></span>'
+    )
 
     def __init__(
         self,
@@ -27,106 +120,151 @@ class TextAnnotator:
         self.evaluator = difficulty_model
         self.dictionary = dictionary
         self.wordwise = wordwise
+        self._template = self.WORDWISE_TEMPLATE if wordwise else self.INLINE_TEMPLATE
 
-    def process_content(self, html_content: bytes) -> bytes:
+    def process_content(
+        self, html_content: Union[bytes, memoryview]
+    ) -> Union[bytes, memoryview]:
         """Process HTML content, annotating difficult words.
 
+        The chapter is streamed through an HTML tokenizer that echoes markup
+        unchanged, so no document tree is built. Difficult words are
+        collected from the whole chapter first so the dictionary can
+        resolve them in a single batch.
+
         Args:
-            html_content: Raw HTML bytes from EPUB chapter.
+            html_content: Raw HTML bytes from EPUB chapter, or a view of them.
 
         Returns:
-            Modified HTML bytes with annotations injected.
+            Modified HTML bytes with annotations injected. Chapters that
+            are not UTF-8 or have nothing to annotate are returned as-is
+            (the same object that was passed in).
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        if not self._needs_processing(html_content):
+            return html_content
 
-        for text_node in list(soup.find_all(string=True)):
-            if not isinstance(text_node, NavigableString):
-                continue
+        try:
+            document = str(html_content, 'utf-8')
+        except UnicodeDecodeError:
+            return html_content
 
-            if text_node.parent.name in self.SKIP_TAGS:
-                continue
+        rewriter = _ChapterRewriter(self.SKIP_TAGS)
+        rewriter.feed(document)
+        rewriter.close()
+
+        # (slot, text, [(match, lowercased word)]) for text worth annotating
+        pending = []
+        candidates = set()
+        is_difficult = self.evaluator.is_difficult
 
-            text = str(text_node)
-            if not text.strip():
+        for slot, text in rewriter.text_slots:
+            if not self._HAS_CANDIDATE.search(text):
                 continue
 
-            new_nodes = self._annotate_text(soup, text)
-            if new_nodes:
-                self._replace_node(text_node, new_nodes)
+            # Lowercase each word once; is_difficult, the lookup and the
+            # definition mapping all work on this form
+            matches = []
+            for match in self.evaluator.extract_words(text):
+                word = match.group()
+                # All-caps tokens are acronyms or initialisms the dictionary lacks
+                if word.isupper():
+                    continue
+                word_lower = word.lower()
+                if is_difficult(word_lower, lowered=True):
+                    matches.append((match, word_lower))
+
+            if matches:
+                pending.append((slot, text, matches))
+                candidates.update(word_lower for _, word_lower in matches)
+
+        if not candidates:
+            return html_content
 
-        return soup.encode(formatter='html')
+        with self.dictionary.read_transaction():
+            definitions = self.dictionary.lookup_many(candidates)
+        # Escape each definition once per chapter rather than per occurrence
+        definitions = {
+            word: escape(definition, quote=False)
+            for word, definition in definitions.items()
+        }
 
-    def _annotate_text(self, soup: BeautifulSoup, text: str) -> Union[list, None]:
-        """Build annotated node list for text.
+        out = rewriter.out
+        # Rendered annotation per surface word; repeats reuse the string
+        fragments: Dict[str, str] = {}
+        replaced = False
+        for slot, text, matches in pending:
+            new_html = self._annotate_text(text, matches, definitions, fragments)
+            if new_html is not None:
+                out[slot] = new_html
+                replaced = True
+
+        # Re-serializing would still normalize entities and tags, so hand
+        # back the input when no word had a definition
+        if not replaced:
+            return html_content
+        return ''.join(out).encode('utf-8')
+
+    def _needs_processing(self, html_content: Union[bytes, memoryview]) -> bool:
+        """Check whether a chapter has enough long words to be worth parsing.
+
+        Scans the raw bytes, before decoding, so front and back matter
+        (cover, copyright, TOC pages) skip the tokenizer entirely.
+
+        Args:
+            html_content: Raw HTML bytes from EPUB chapter, or a view of them.
+
+        Returns:
+            True once at least _MIN_LONG_WORDS runs of 6+ letters are found.
+        """
+        remaining = self._MIN_LONG_WORDS
+        for _ in self._LONG_WORD_BYTES.finditer(html_content):
+            remaining -= 1
+            if not remaining:
+                return True
+        return False
+
+    def _annotate_text(
+        self,
+        text: str,
+        matches: List[Tuple[re.Match, str]],
+        definitions: Dict[str, str],
+        fragments: Dict[str, str],
+    ) -> Optional[str]:
+        """Build annotated HTML for text.
 
         Args:
-            soup: BeautifulSoup instance for creating new tags.
             text: Text content to annotate.
+            matches: Difficult word matches within text, with lowercased words.
+            definitions: HTML-escaped definitions keyed by lowercased word.
+            fragments: Per-chapter cache of rendered annotations by surface
+                word ('' for words without a definition); filled in here.
 
         Returns:
-            List of nodes if modifications made, None otherwise.
+            HTML markup if modifications made, None otherwise.
         """
-        new_nodes = []
+        parts = []
         last_idx = 0
-        modified = False
 
-        for match in self.evaluator.extract_words(text):
+        for match, word_lower in matches:
             word = match.group()
 
-            if not self.evaluator.is_difficult(word):
-                continue
+            fragment = fragments.get(word)
+            if fragment is None:
+                definition = definitions.get(word_lower)
+                fragment = self._template.format(
+                    word=word, definition=definition
+                ) if definition else ''
+                fragments[word] = fragment
 
-            definition = self.dictionary.lookup(word)
-            if not definition:
+            if not fragment:
                 continue
 
-            modified = True
-
-            if match.start() > last_idx:
-                new_nodes.append(soup.new_string(text[last_idx:match.start()]))
-
-            if self.wordwise:
-                wrapper_tag = "ruby"
-                annotation_tag = "rt"
-                annotation_text = definition
-                wrapper_classes = ["annotated-word", "wordwise"]
-            else:
-                wrapper_tag = "span"
-                annotation_tag = "span"
-                annotation_text = f" ({definition})"
-                wrapper_classes = ["annotated-word"]
-
-            wrapper = soup.new_tag(wrapper_tag, attrs={"class": wrapper_classes})
-            wrapper.string = word
-
-            annotation = soup.new_tag(annotation_tag, attrs={"class": "annotation"})
-            annotation.string = annotation_text
-            wrapper.append(annotation)
-
-            new_nodes.append(wrapper)
+            parts.append(escape(text[last_idx:match.start()], quote=False))
+            parts.append(fragment)
             last_idx = match.end()
 
-        if not modified:
+        if not parts:
             return None
 
-        if last_idx < len(text):
-            new_nodes.append(soup.new_string(text[last_idx:]))
-
-        return new_nodes
-
-    def _replace_node(
-        self,
-        original_node: NavigableString,
-        new_nodes: list,
-    ) -> None:
-        """Replace a text node with annotated nodes.
-
-        Args:
-            original_node: The original NavigableString to replace.
-            new_nodes: List of replacement nodes.
-        """
-        current = original_node
-        for node in new_nodes:
-            current.insert_after(node)
-            current = node
-        original_node.extract()
+        parts.append(escape(text[last_idx:], quote=False))
+        return ''.join(parts)
@@ -3,8 +3,9 @@
 import re
 import sqlite3
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 
 
 class BaseDictionary(ABC):
@@ -25,6 +26,36 @@ class BaseDictionary(ABC):
         """
         pass
 
+    def lookup_many(self, words: Iterable[str]) -> Dict[str, str]:
+        """Look up several words at once.
+
+        The default implementation calls `lookup` per word; backends with
+        cheaper bulk access should override it.
+
+        Args:
+            words: Words to look up (duplicates allowed).
+
+        Returns:
+            Mapping from lowercased word to definition, for words found.
+        """
+        results = {}
+        for word in words:
+            key = word.lower()
+            if key in results:
+                continue
+            definition = self.lookup(word)
+            if definition:
+                results[key] = definition
+        return results
+
+    @contextmanager
+    def read_transaction(self) -> Iterator[None]:
+        """Group lookups into one read transaction, where supported.
+
+        The default implementation does nothing.
+        """
+        yield
+
 
 class SimpleLocalDictionary(BaseDictionary):
     """Simple in-memory dictionary for demonstration.
@@ -77,8 +108,22 @@ class ECDictSqlite(BaseDictionary):
     """
 
     _LEMMA_PATTERN = re.compile(r'[012]:(\w+)')
+    # Definitions (and, separately, misses) remembered across chapters;
+    # the least recently used are dropped first
+    _CACHE_SIZE = 100_000
+    # Words per IN (...) query, kept under SQLITE_MAX_VARIABLE_NUMBER (999)
+    _BATCH_SIZE = 900
+    # Read-only tuning: 256MB mmap, 64MB page cache, in-memory temp tables
+    _READ_PRAGMAS = (
+        "PRAGMA query_only = 1",
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA mmap_size = 268435456",
+        "PRAGMA cache_size = -65536",
+    )
     # Pattern to match POS prefix like "n. ", "v. ", "adj. "
     _POS_PATTERN = re.compile(r'^[a-z]{1,4}\.\s*')
+    # Separators between meanings: EN/CN commas and semicolons
+    _SPLIT_PATTERN = re.compile(r'[,，;；]')
     # Pattern to remove bracketed content: () （） [] 【】 {} 〈〉 <>
     # Matches: opening bracket + any non-closing chars + closing bracket
     _PAREN_PATTERN = re.compile(
@@ -91,20 +136,37 @@ class ECDictSqlite(BaseDictionary):
                  include_phonetic: bool = True):
         """Initialize with path to stardict.db.
 
+        The database is opened read-only and immutable, so SQLite skips
+        file locking and change detection.
+
         Args:
             db_path: Path to ECDICT SQLite database file.
             max_definitions: Maximum number of definitions to include (default: 2).
             include_phonetic: Whether to include phonetic notation (default: True).
         """
-        self._conn = sqlite3.connect(str(db_path))
+        uri = f"{Path(db_path).resolve().as_uri()}?mode=ro&immutable=1"
+        # Batched IN (...) queries vary in arity, so keep more statements prepared
+        self._conn = sqlite3.connect(uri, uri=True, cached_statements=256)
         self._conn.row_factory = sqlite3.Row
+        # Reused by every query instead of allocating a cursor per lookup
+        self._cursor = self._conn.cursor()
+        for pragma in self._READ_PRAGMAS:
+            self._cursor.execute(pragma)
         self._max_definitions = max_definitions
         self._include_phonetic = include_phonetic
+        # Lowercased word -> formatted definition, filled by lookup and
+        # lookup_many so words seen in earlier chapters skip SQLite
+        self._memo: Dict[str, str] = {}
+        # Lowercased words known to have no definition (the database is
+        # read-only, so a miss stays a miss); shared by lookup and lookup_many.
+        # Values are unused: a dict keeps the recency order for eviction
+        self._oov: Dict[str, None] = {}
 
     def lookup(self, word: str) -> Optional[str]:
         """Look up word in ECDICT.
 
-        Attempts direct lookup first, then tries lemma forms.
+        Attempts direct lookup first, then tries lemma forms. Results
+        (including misses) are remembered and shared with lookup_many.
 
         Args:
             word: The word to look up.
@@ -112,12 +174,31 @@ class ECDictSqlite(BaseDictionary):
         Returns:
             Concise translation with optional phonetic, None if not found.
         """
-        cursor = self._conn.cursor()
+        word_lower = word.lower()
+        definition = self._recall(word_lower)
+        if definition is not None or self._is_oov(word_lower):
+            return definition
+
+        definition = self._lookup_uncached(word_lower)
+        if definition is not None:
+            self._remember(self._memo, word_lower, definition)
+        return definition
+
+    def _lookup_uncached(self, word: str) -> Optional[str]:
+        """Query the database for a single lowercased word.
+
+        Args:
+            word: Lowercased word to look up.
+
+        Returns:
+            Concise translation with optional phonetic, None if not found.
+        """
+        cursor = self._cursor
 
         # Direct lookup (COLLATE NOCASE handles case)
         cursor.execute(
             "SELECT phonetic, translation, exchange FROM stardict WHERE word = ?",
-            (word.lower(),),
+            (word,),
         )
         row = cursor.fetchone()
 
@@ -138,8 +219,150 @@ class ECDictSqlite(BaseDictionary):
                         lemma_row['phonetic'], lemma_row['translation']
                     )
 
+        self._remember(self._oov, word, None)
         return None
 
+    def lookup_many(self, words: Iterable[str]) -> Dict[str, str]:
+        """Look up many words with batched queries.
+
+        Words resolved or found missing by earlier calls are answered from
+        memory. The rest take one query per batch of words, then one more
+        batch for the lemmas of words that have no translation of their own.
+
+        Args:
+            words: Words to look up (duplicates allowed).
+
+        Returns:
+            Mapping from lowercased word to formatted definition, for words found.
+        """
+        results = {}
+        unique_words = []
+        for word in dict.fromkeys(word.lower() for word in words):
+            definition = self._recall(word)
+            if definition is not None:
+                results[word] = definition
+            elif not self._is_oov(word):
+                unique_words.append(word)
+
+        if not unique_words:
+            return results
+        rows = self._fetch_rows(unique_words)
+        # lemma -> inflected words waiting on its translation
+        pending_lemmas: Dict[str, List[str]] = {}
+
+        for word in unique_words:
+            row = rows.get(word)
+            if row is None:
+                continue
+
+            if row['translation']:
+                results[word] = self._format_result(row['phonetic'], row['translation'])
+            elif row['exchange']:
+                lemma = self._extract_lemma(row['exchange'])
+                if lemma:
+                    pending_lemmas.setdefault(lemma.lower(), []).append(word)
+
+        if pending_lemmas:
+            lemma_rows = self._fetch_rows(list(pending_lemmas))
+            for lemma, inflected in pending_lemmas.items():
+                row = lemma_rows.get(lemma)
+                if row and row['translation']:
+                    definition = self._format_result(row['phonetic'], row['translation'])
+                    for word in inflected:
+                        results[word] = definition
+
+        for word in unique_words:
+            definition = results.get(word)
+            if definition is None:
+                self._remember(self._oov, word, None)
+            else:
+                self._remember(self._memo, word, definition)
+        return results
+
+    def _recall(self, word: str) -> Optional[str]:
+        """Fetch a memoized definition, marking it most recently used.
+
+        Args:
+            word: Lowercased word.
+
+        Returns:
+            The memoized definition, None if not memoized.
+        """
+        definition = self._memo.pop(word, None)
+        if definition is not None:
+            # Re-inserting moves the entry to the end of the eviction order
+            self._memo[word] = definition
+        return definition
+
+    def _is_oov(self, word: str) -> bool:
+        """Check for a remembered miss, marking it most recently used.
+
+        Args:
+            word: Lowercased word.
+
+        Returns:
+            True if an earlier lookup found no definition for the word.
+        """
+        if word not in self._oov:
+            return False
+        self._oov[word] = self._oov.pop(word)
+        return True
+
+    def _remember(self, cache: Dict[str, Optional[str]], word: str,
+                  definition: Optional[str]) -> None:
+        """Add an entry to the memo or the miss cache, evicting the least
+        recently used entry when full.
+
+        Args:
+            cache: self._memo or self._oov.
+            word: Lowercased word.
+            definition: Its formatted definition, None for a miss.
+        """
+        if len(cache) >= self._CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[word] = definition
+
+    @contextmanager
+    def read_transaction(self) -> Iterator[None]:
+        """Hold one SQLite read transaction across the enclosed lookups.
+
+        Nested use joins the transaction already open.
+        """
+        if self._conn.in_transaction:
+            yield
+            return
+
+        self._cursor.execute("BEGIN")
+        try:
+            yield
+        finally:
+            self._cursor.execute("COMMIT")
+
+    def _fetch_rows(self, words: List[str]) -> Dict[str, sqlite3.Row]:
+        """Fetch dictionary rows for words in batches.
+
+        Args:
+            words: Lowercased, deduplicated words.
+
+        Returns:
+            Mapping from lowercased word to its database row.
+        """
+        cursor = self._cursor
+        rows = {}
+
+        for start in range(0, len(words), self._BATCH_SIZE):
+            batch = words[start:start + self._BATCH_SIZE]
+            placeholders = ','.join('?' * len(batch))
+            cursor.execute(
+                "SELECT word, phonetic, translation, exchange FROM stardict "
+                f"WHERE word IN ({placeholders})",
+                batch,
+            )
+            for row in cursor.fetchall():
+                rows[row['word'].lower()] = row
+
+        return rows
+
     def _format_result(self, phonetic: Optional[str],
                        translation: str) -> str:
         """Format the lookup result with phonetic and concise translation.
@@ -173,13 +396,14 @@ class ECDictSqlite(BaseDictionary):
             if not line:
                 continue
 
-            # Remove POS prefix like "n. " or "vt. "
-            line = self._POS_PATTERN.sub('', line)
+            # Remove POS prefix like "n. " or "vt. " (its dot is within 5 chars)
+            if '.' in line[:5]:
+                line = self._POS_PATTERN.sub('', line)
             # Remove parenthetical explanations
             line = self._PAREN_PATTERN.sub('', line).strip()
 
             # Split by Chinese/English comma or semicolon, take first few
-            parts = re.split(r'[,，;；]', line)
+            parts = self._SPLIT_PATTERN.split(line)
             for part in parts:
                 part = part.strip()
                 if part and part not in definitions:
@@ -1,17 +1,10 @@
 """Difficulty evaluation module using word frequency analysis (Zipf scale)."""
 
+import functools
 import re
-from typing import Iterator
+from typing import Iterator, List
 
-import nltk
-from nltk.stem import WordNetLemmatizer
-from wordfreq import zipf_frequency
-
-# Ensure WordNet data is available
-try:
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    nltk.download('wordnet', quiet=True)
+from wordfreq import freq_to_zipf, get_frequency_dict
 
 
 class DifficultyEvaluator:
@@ -23,8 +16,43 @@ class DifficultyEvaluator:
     - ~2.0: Rare words (e.g., "esoteric")
     """
 
-    # WordNet POS tags: n=noun, v=verb, a=adjective, r=adverb
-    _POS_TAGS = ('v', 'n', 'a', 'r')
+    # Inflectional suffix -> replacements that restore the base form.
+    # Checked in order, first match wins (e.g. studies -> study, hoped -> hope).
+    _SUFFIX_RULES = (
+        ('iest', ('y',)),
+        ('ies', ('y',)),
+        ('ied', ('y',)),
+        ('ier', ('y',)),
+        ('ily', ('y',)),
+        ('ing', ('', 'e')),
+        ('est', ('', 'e')),
+        ('ed', ('', 'e')),
+        ('er', ('', 'e')),
+        ('es', ('', 'e')),
+        ('ly', ('',)),
+        ('s', ('',)),
+    )
+    # Suffixes whose consonant doubling may be undone, mapped to the sibling
+    # suffix that must form a known word on the same doubled stem
+    # (hugged -> hug needs hugging; herring -> her has no herred)
+    _DOUBLING_SIBLINGS = {'ing': 'ed', 'ed': 'ing', 'er': 'est', 'est': 'er'}
+    # Comparative suffixes also end plain nouns (ponder, adder), so they are
+    # only stripped when the other degree is a known word (calmer/calmest)
+    _COMPARATIVE_SUFFIXES = frozenset(['er', 'est'])
+    # Endings that take -es rather than -s (boxes, churches, heroes);
+    # elsewhere -es is a silent e plus -s (manes -> mane, never man)
+    _ES_ENDINGS = ('s', 'x', 'z', 'ch', 'sh', 'o')
+    # A one-syllable stem with a single short vowel doubles its consonant
+    # before -ed/-ing (dotted, hopping), so an undoubled one points at a
+    # silent e (doted -> dote)
+    _SHORT_SYLLABLE = re.compile(r'^[^aeiou]*[aeiou][^aeiouwxy]$')
+    # A base form this much more frequent (in Zipf units, here 1000x) than
+    # a known word is a different word, not its lemma (mores -> more,
+    # seer -> see, hissing -> his)
+    _MAX_BASE_GAP = 3.0
+    # Bound on remembered verdicts for non-common words; common words are
+    # settled by a set lookup and never reach the cache
+    _CACHE_SIZE = 100_000
 
     def __init__(self, lang: str = 'en', threshold: float = 3.5):
         """
@@ -36,42 +64,124 @@ class DifficultyEvaluator:
         """
         self.lang = lang
         self.threshold = threshold
-        self._lemmatizer = WordNetLemmatizer()
+        # Zipf values for the whole wordlist, rounded like zipf_frequency
+        self._zipf = zipf = {
+            word: round(freq_to_zipf(freq), 2)
+            for word, freq in get_frequency_dict(lang).items()
+        }
+        # The threshold split is static, so classify the wordlist once
+        self._common = frozenset(w for w, f in zipf.items() if f >= threshold)
+        self._difficult = frozenset(w for w, f in zipf.items() if 0 < f < threshold)
         # Exclude words adjacent to apostrophes (contractions like hadn't, isn't)
         # U+0027 ' U+2018 ' U+2019 ' U+02BC ʼ U+0060 `
+        # Word boundaries are folded into the lookarounds (\w plus apostrophes),
+        # which matches the same spans as \b...\b with fewer checks per position.
         self._word_pattern = re.compile(
-            r"(?<![\u0027\u2018\u2019\u02BC\u0060])\b[a-zA-Z]{3,}\b(?![\u0027\u2018\u2019\u02BC\u0060])"
+            r"(?<![\w\u0027\u2018\u2019\u02BC\u0060])[a-zA-Z]{3,}(?![\w\u0027\u2018\u2019\u02BC\u0060])"
+        )
+        # Memo around _classify: candidate generation runs once per distinct word
+        self._classify_cached = functools.lru_cache(maxsize=self._CACHE_SIZE)(
+            self._classify
         )
 
-    def _get_max_lemma_freq(self, word: str) -> float:
-        """Get maximum frequency across word and its lemma forms.
+    def _classify(self, word_lower: str) -> bool:
+        """Classify a lowercased word against the precomputed sets.
+
+        Equivalent to checking that the maximum frequency across the word
+        and its lemma candidates is above 0 and below the threshold.
 
         Args:
-            word: The word to evaluate.
+            word_lower: The lowercased word to evaluate.
+
+        Returns:
+            True if no candidate is common and at least one is known.
+        """
+        candidates = self._candidate_lemmas(word_lower)
+        if any(c in self._common for c in candidates):
+            return False
+        return any(c in self._difficult for c in candidates)
+
+    def _candidate_lemmas(self, word_lower: str) -> List[str]:
+        """List the word and its likely base forms by suffix stripping.
+
+        A cheap stand-in for dictionary lemmatization: candidates that are
+        not real words are in neither frequency set and never matter.
+        Stripping that would turn a plain word into a common stem (herring
+        -> her, patter -> pat, ponder -> pond) is ruled out by requiring a
+        sibling inflection to exist, by restoring a silent e (manes -> mane)
+        and by dropping bases far more frequent than a known word.
+
+        Args:
+            word_lower: The lowercased word.
 
         Returns:
-            Maximum Zipf frequency found among original word and lemmas.
+            The word followed by at most 3 suffix-stripped variants,
+            e.g. studied -> [studied, study].
         """
-        word_lower = word.lower()
-        max_freq = zipf_frequency(word_lower, self.lang)
+        candidates = [word_lower]
+
+        for suffix, replacements in self._SUFFIX_RULES:
+            if not word_lower.endswith(suffix):
+                continue
+
+            stem = word_lower[:-len(suffix)]
+            sibling = self._DOUBLING_SIBLINGS.get(suffix)
+            has_sibling = sibling is not None and self._is_known(stem + sibling)
+            if suffix in self._COMPARATIVE_SUFFIXES and not has_sibling:
+                break
+
+            for replacement in replacements:
+                if not replacement and not self._keeps_bare_stem(suffix, stem):
+                    continue
+                candidates.append(stem + replacement)
+
+            # Undo consonant doubling: stopped -> stop, bigger -> big
+            if (has_sibling and len(stem) > 2
+                    and stem[-1] == stem[-2] and stem[-1] not in 'aeiou'
+                    and self._is_known(stem[:-1])):
+                candidates.append(stem[:-1])
+            break
+
+        # Skip stems too short to be meaningful words (bed -> b, be)
+        candidates = [c for c in candidates if len(c) >= 3]
+        word_zipf = self._zipf.get(word_lower)
+        if word_zipf is not None and len(candidates) > 1:
+            ceiling = word_zipf + self._MAX_BASE_GAP
+            candidates[1:] = [
+                c for c in candidates[1:] if self._zipf.get(c, 0) <= ceiling
+            ]
+        return candidates
+
+    def _keeps_bare_stem(self, suffix: str, stem: str) -> bool:
+        """Check whether a stem without a restored silent e is a candidate.
 
-        for pos in self._POS_TAGS:
-            lemma = self._lemmatizer.lemmatize(word_lower, pos)
-            if lemma != word_lower:
-                freq = zipf_frequency(lemma, self.lang)
-                if freq > max_freq:
-                    max_freq = freq
+        Args:
+            suffix: The stripped suffix.
+            stem: The word without the suffix.
 
-        return max_freq
+        Returns:
+            False where the e-form is the likely base instead (manes ->
+            mane, not man; doted -> dote, not dot).
+        """
+        if suffix == 'es':
+            return stem.endswith(self._ES_ENDINGS)
+        if suffix in ('ed', 'ing') and self._SHORT_SYLLABLE.match(stem):
+            return not self._is_known(stem + 'e')
+        return True
+
+    def _is_known(self, word_lower: str) -> bool:
+        """Check whether a lowercased word is in the frequency wordlist."""
+        return word_lower in self._common or word_lower in self._difficult
 
-    def is_difficult(self, word: str) -> bool:
+    def is_difficult(self, word: str, lowered: bool = False) -> bool:
         """Determine if a word is considered difficult.
 
-        Uses lemmatization to evaluate based on root word frequency,
-        preventing simple words with affixes from being marked difficult.
+        Evaluates suffix-stripped base forms as well, preventing simple
+        words with inflections from being marked difficult.
 
         Args:
             word: The word to evaluate.
+            lowered: Whether word is already lowercase, skipping str.lower().
 
         Returns:
             True if max frequency (word or lemma) is above 0 and below threshold.
@@ -79,8 +189,13 @@ class DifficultyEvaluator:
         if len(word) < 3:
             return False
 
-        freq = self._get_max_lemma_freq(word)
-        return 0 < freq < self.threshold
+        word_lower = word if lowered else word.lower()
+        # Most running text is common words: settle them with one set lookup
+        # before candidate generation, keeping them out of the LRU cache
+        if word_lower in self._common:
+            return False
+
+        return self._classify_cached(word_lower)
 
     def extract_words(self, text: str) -> Iterator[re.Match]:
         """Extract all word matches from text.
@@ -1,11 +1,265 @@
 """EPUB file handling: reading, writing, and CSS injection."""
 
+import functools
+import io
+import mmap
+import os
+import posixpath
+import shutil
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterator, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import unquote
 
-import ebooklib
 from ebooklib import epub
 
+# zlib-ng is optional: same API and stream format, several times faster
+try:
+    from zlib_ng import zlib_ng as zlib
+except ImportError:
+    import zlib
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# ioctl request for a copy-on-write file clone (linux/fs.h); fcntl only
+# exposes FICLONE from Python 3.12
+_FICLONE = getattr(fcntl, 'FICLONE', 0x40049409)
+
+# Stylesheet link added to every chapter by EpubHandler.add_css
+_CSS_LINK = {
+    "href": "style/annotation.css",
+    "rel": "stylesheet",
+    "type": "text/css",
+}
+
+
+class _MappedFile(mmap.mmap):
+    """Read-only memory map usable as a ZipFile source.
+
+    mmap only gained seekable() in Python 3.13; zipfile calls it when
+    opening members.
+    """
+
+    def seekable(self) -> bool:
+        return True
+
+
+def _deflate(data: bytes, level: int) -> Tuple[bytes, int]:
+    """Compress data the way ZipFile stores a deflated entry.
+
+    Args:
+        data: Uncompressed entry payload.
+        level: zlib compression level.
+
+    Returns:
+        Raw deflate stream (no zlib header) and CRC-32 of data.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush(), zlib.crc32(data)
+
+
+class _PrefetchingEpubReader(epub.EpubReader):
+    """EpubReader that inflates manifest items up front, in parallel.
+
+    ebooklib reads items one at a time while it walks the manifest. Here
+    every file the manifest references is decompressed on a thread pool
+    first (zlib releases the GIL), and read_file serves the results.
+    Anything else, or anything that failed to prefetch, is read on demand
+    as before, so errors surface only for files ebooklib asks for.
+    """
+
+    def __init__(self, epub_file_name, options=None):
+        super().__init__(epub_file_name, options)
+        self._members: Dict[str, bytes] = {}
+
+    def _load_manifest(self):
+        names = self._manifest_members()
+        with ThreadPoolExecutor() as executor:
+            for name, data in zip(names, executor.map(self._try_read, names)):
+                if data is not None:
+                    self._members[name] = data
+        super()._load_manifest()
+
+    def _manifest_members(self) -> List[str]:
+        """List archive members referenced by manifest hrefs."""
+        manifest = self.container.find(f"{{{epub.NAMESPACES['OPF']}}}manifest")
+        if manifest is None:
+            return []
+
+        names = set()
+        for element in manifest:
+            href = element.get('href')
+            if not href:
+                continue
+            # ebooklib joins some hrefs unquoted and some as written
+            for path in (unquote(href), href):
+                names.add(posixpath.normpath(posixpath.join(self.opf_dir, path)))
+        return [name for name in names if name in self.zf.NameToInfo]
+
+    def _try_read(self, name: str) -> Optional[bytes]:
+        """Read a member, or return None if it can't be read."""
+        try:
+            return self.zf.read(name)
+        except Exception:
+            return None  # Re-raised by read_file if ebooklib needs it
+
+    def read_file(self, name):
+        data = self._members.get(posixpath.normpath(name))
+        if data is None:
+            return super().read_file(name)
+        return data
+
+
+class _ParallelEpubWriter(epub.EpubWriter):
+    """EpubWriter that deflates items on a thread pool.
+
+    ebooklib compresses and writes items one at a time. Here every item's
+    payload is collected first and compressed concurrently (zlib releases
+    the GIL); the finished streams are appended to the archive in the
+    original order. Items whose bytes are unchanged from the source
+    archive reuse its compressed stream instead, and compressed media is
+    stored as-is.
+    """
+
+    # Level 1 skips lazy matching: a few percent larger, several times faster
+    DEFAULT_OPTIONS = dict(epub.EpubWriter.DEFAULT_OPTIONS, compresslevel=1)
+    # Media that is already compressed is stored rather than deflated
+    _STORED_PREFIXES = ('image/', 'audio/', 'video/')
+    _STORED_TYPES = frozenset([
+        'font/woff', 'font/woff2', 'application/font-woff', 'application/font-woff2',
+    ])
+    # Text formats under the prefixes above, which still deflate well
+    _DEFLATED_TYPES = frozenset(['image/svg+xml'])
+
+    def __init__(self, name, book, options=None,
+                 source: Optional[zipfile.ZipFile] = None, source_dir: str = ''):
+        """
+        Args:
+            name: Output file name or writable file object.
+            book: The EpubBook to write.
+            options: ebooklib writer options.
+            source: Archive the book was read from, if still available.
+            source_dir: Directory of the OPF file within source.
+        """
+        super().__init__(name, book, options)
+        self._source = source
+        self._source_dir = source_dir
+
+    def _write_items(self):
+        # (name, payload, (compress_type, stream, crc) if reused from source)
+        entries = [self._item_entry(item) for item in self.book.get_items()]
+        deflate = functools.partial(_deflate, level=self.options['compresslevel'])
+
+        with ThreadPoolExecutor() as executor:
+            streams = executor.map(
+                deflate, [data for _, data, raw in entries if raw is None]
+            )
+            for name, data, raw in entries:
+                if raw is None:
+                    compressed, crc = next(streams)
+                    raw = (zipfile.ZIP_DEFLATED, compressed, crc)
+                self._write_compressed(name, len(data), *raw)
+
+    def _item_entry(
+        self, item: epub.EpubItem
+    ) -> Tuple[str, bytes, Optional[Tuple[int, bytes, int]]]:
+        """Return the archive name and payload ebooklib writes for item.
+
+        The third element is the item's stream as it will be stored when
+        no deflating is needed: the source archive's copy when the payload
+        is unchanged, or the payload itself for compressed media. It is
+        None for items left to the thread pool.
+        """
+        folder = self.book.FOLDER_NAME
+        if isinstance(item, epub.EpubNcx):
+            return f"{folder}/{item.file_name}", self._get_ncx(), None
+        if isinstance(item, epub.EpubNav):
+            return f"{folder}/{item.file_name}", self._get_nav(item), None
+
+        data = item.get_content()
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        raw = self._source_stream(item.file_name, data)
+        if raw is None and self._is_precompressed(item.media_type):
+            raw = (zipfile.ZIP_STORED, data, zlib.crc32(data))
+        if item.manifest:
+            return f"{folder}/{item.file_name}", data, raw
+        return item.file_name, data, raw
+
+    def _is_precompressed(self, media_type: str) -> bool:
+        """Check whether a media type is already compressed (JPEG, PNG, WOFF...)."""
+        if media_type in self._DEFLATED_TYPES:
+            return False
+        return (media_type in self._STORED_TYPES
+                or media_type.startswith(self._STORED_PREFIXES))
+
+    def _source_stream(self, file_name: str,
+                       data: bytes) -> Optional[Tuple[int, bytes, int]]:
+        """Look up an unchanged copy of data in the source archive.
+
+        Args:
+            file_name: Item file name, relative to the OPF directory.
+            data: The item's current payload.
+
+        Returns:
+            (compress_type, compressed stream, crc) of the source member if
+            its size and CRC-32 match data, None otherwise.
+        """
+        if self._source is None:
+            return None
+        try:
+            zinfo = self._source.getinfo(
+                posixpath.normpath(posixpath.join(self._source_dir, file_name))
+            )
+        except KeyError:
+            return None
+
+        if (zinfo.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+                or zinfo.flag_bits & 0x1  # encrypted
+                or zinfo.file_size != len(data)
+                or zinfo.CRC != zlib.crc32(data)):
+            return None
+
+        with self._source.open(zinfo) as member:
+            # Positioned just past the local header: read the stream as stored
+            stream = member._fileobj.read(zinfo.compress_size)
+        return zinfo.compress_type, stream, zinfo.CRC
+
+    def _write_compressed(self, name: str, file_size: int, compress_type: int,
+                          stream: bytes, crc: int) -> None:
+        """Append an already-compressed entry, as ZipFile.writestr would.
+
+        Args:
+            name: Archive member name.
+            file_size: Size of the uncompressed payload.
+            compress_type: ZIP_STORED or ZIP_DEFLATED, matching stream.
+            stream: Entry data as stored in the archive.
+            crc: CRC-32 of the uncompressed payload.
+        """
+        zf = self.out
+        zinfo = zipfile.ZipInfo(name, date_time=time.localtime(time.time())[:6])
+        zinfo.compress_type = compress_type
+        zinfo.external_attr = 0o600 << 16
+        zinfo.file_size = file_size
+        zinfo.compress_size = len(stream)
+        zinfo.CRC = crc
+
+        # ZipFile has no public API for pre-compressed data
+        with zf._lock:
+            zf.fp.seek(zf.start_dir)
+            zinfo.header_offset = zf.start_dir
+            zf.fp.write(zinfo.FileHeader())
+            zf.fp.write(stream)
+            zf.start_dir = zf.fp.tell()
+            zf.filelist.append(zinfo)
+            zf.NameToInfo[name] = zinfo
+            zf._didModify = True
+
 
 class EpubHandler:
     """Encapsulates ebooklib operations for EPUB manipulation."""
@@ -13,20 +267,78 @@ class EpubHandler:
     def __init__(self, input_path: Union[str, Path]):
         """Load an EPUB file.
 
+        The file is memory-mapped and stays open until close(), so saving
+        can copy unchanged entries from it.
+
         Args:
             input_path: Path to the EPUB file.
         """
-        self.book = epub.read_epub(str(input_path))
+        self._input_path = os.fspath(input_path)
+        self._file = open(self._input_path, 'rb')
+        try:
+            self._mmap = _MappedFile(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            # Same steps as epub.read_epub, keeping the reader's OPF location;
+            # ZipFile reads the mapping like any seekable file object.
+            # Manifest items are inflated in parallel before ebooklib reads them.
+            reader = _PrefetchingEpubReader(self._mmap)
+            self.book = reader.load()
+            reader.process()
+        except Exception:
+            self.close()
+            raise
+        self._opf_dir = reader.opf_dir
+        # Document items, collected on first use (CSS items never join it)
+        self._html_items: Optional[List[epub.EpubHtml]] = None
+        # TOC entries in document order; the TOC itself is never edited here
+        self._toc_flat = self._flatten_toc()
+        # Set by every mutation; an unmodified book is saved as a file copy
+        self._dirty = False
 
-    def get_html_items(self) -> Iterator[epub.EpubHtml]:
-        """Yield all document items (chapters) from the EPUB.
+    @property
+    def modified(self) -> bool:
+        """Whether the book has changed since it was loaded."""
+        return self._dirty
 
-        Yields:
+    def get_html_items(self) -> List[epub.EpubHtml]:
+        """List all document items (chapters) in the EPUB.
+
+        The book is scanned once; later calls return the same list, which
+        callers should not modify.
+
+        Returns:
             EpubHtml items containing chapter content.
         """
-        for item in self.book.get_items():
-            if item.get_type() == ebooklib.ITEM_DOCUMENT:
-                yield item
+        if self._html_items is None:
+            # Only EpubHtml (and its subclasses) report ITEM_DOCUMENT, so a
+            # type check stands in for the get_type() call
+            self._html_items = [
+                item for item in self.book.get_items()
+                if isinstance(item, epub.EpubHtml)
+            ]
+        return self._html_items
+
+    def get_html_items_mv(self) -> Iterator[Tuple[epub.EpubHtml, memoryview]]:
+        """Iterate over document items with a view of their raw bytes.
+
+        Unlike item.get_content(), which re-renders the document through
+        lxml, the view exposes the bytes read from the archive without
+        copying them.
+
+        Yields:
+            (item, memoryview of item.content) pairs.
+        """
+        for item in self.get_html_items():
+            yield item, memoryview(item.content)
+
+    def set_item_content(self, item: epub.EpubItem, content: bytes) -> None:
+        """Replace an item's content, marking the book as modified.
+
+        Args:
+            item: Item belonging to this book.
+            content: New raw content.
+        """
+        item.set_content(content)
+        self._dirty = True
 
     def add_css(self, css_string: str) -> None:
         """Inject CSS stylesheet into the EPUB.
@@ -36,44 +348,118 @@ class EpubHandler:
         """
         css_item = epub.EpubItem(
             uid="annotation_style",
-            file_name="style/annotation.css",
+            file_name=_CSS_LINK["href"],
             media_type="text/css",
             content=css_string.encode('utf-8'),
         )
         self.book.add_item(css_item)
 
-        for item in self.book.get_items():
-            if item.get_type() == ebooklib.ITEM_DOCUMENT:
-                item.add_link(
-                    href="style/annotation.css",
-                    rel="stylesheet",
-                    type="text/css",
-                )
+        # Every chapter shares one link dict; ebooklib only reads it when
+        # rendering, whereas add_link would build a new dict per chapter
+        for item in self.get_html_items():
+            item.links.append(_CSS_LINK)
+        self._dirty = True
 
-    def _fix_toc_uids(self) -> None:
-        """Ensure all TOC items have valid UIDs (ebooklib bug workaround)."""
-        def fix_item(item, idx: int) -> int:
+    def _flatten_toc(self) -> list:
+        """Collect TOC entries that carry a uid, in document order.
+
+        Walks the TOC depth-first with an explicit stack, each section
+        before its children. Objects without a uid attribute are skipped.
+
+        Returns:
+            Flat list of TOC entries (Link/Section objects).
+        """
+        flat = []
+        # Pushed in reverse so items pop in their original order
+        stack = list(reversed(self.book.toc))
+        while stack:
+            item = stack.pop()
             if isinstance(item, tuple):
-                section, children = item
-                if hasattr(section, 'uid') and section.uid is None:
-                    section.uid = f"nav_{idx}"
-                    idx += 1
-                for child in children:
-                    idx = fix_item(child, idx)
-            elif hasattr(item, 'uid') and item.uid is None:
-                item.uid = f"nav_{idx}"
-                idx += 1
-            return idx
+                item, children = item
+                stack.extend(reversed(children))
+            if hasattr(item, 'uid'):
+                flat.append(item)
+        return flat
 
+    def _fix_toc_uids(self) -> None:
+        """Ensure all TOC items have valid UIDs (ebooklib bug workaround).
+
+        Scans the TOC entries flattened at load time, numbering the ones
+        without a uid in document order.
+        """
         idx = 0
-        for item in self.book.toc:
-            idx = fix_item(item, idx)
+        for item in self._toc_flat:
+            if item.uid is None:
+                item.uid = "nav_" + str(idx)
+                idx += 1
 
     def save(self, output_path: Union[str, Path]) -> None:
         """Write the EPUB to disk.
 
+        The archive is assembled in memory and written out in one go,
+        rather than item by item into the output file. Items are
+        compressed in parallel; those unchanged since loading keep their
+        original compressed data. An unmodified book is copied byte for
+        byte instead.
+
         Args:
             output_path: Destination path for the modified EPUB.
         """
+        if not self._dirty:
+            self._copy_input(output_path)
+            return
+
         self._fix_toc_uids()
-        epub.write_epub(str(output_path), self.book)
+
+        buffer = io.BytesIO()
+        # Unchanged items are copied from the input archive still compressed
+        with zipfile.ZipFile(self._mmap) as source:
+            # Same steps as epub.write_epub, but ZipFile targets the buffer
+            writer = _ParallelEpubWriter(
+                buffer, self.book, source=source, source_dir=self._opf_dir
+            )
+            writer.process()
+            writer.write()
+
+        # getbuffer() exposes the archive without copying it, as getvalue() would
+        with open(os.fspath(output_path), 'wb') as out:
+            out.write(buffer.getbuffer())
+
+    def _copy_input(self, output_path: Union[str, Path]) -> None:
+        """Copy the input file to output_path unchanged.
+
+        Tries a copy-on-write clone first (btrfs, XFS), which shares the
+        data blocks instead of copying them, then falls back to a plain
+        file copy.
+
+        Args:
+            output_path: Destination path.
+        """
+        output_path = os.fspath(output_path)
+        if os.path.exists(output_path) and os.path.samefile(output_path, self._input_path):
+            return
+
+        if fcntl is not None:
+            try:
+                with open(output_path, 'wb') as out:
+                    fcntl.ioctl(out.fileno(), _FICLONE, self._file.fileno())
+                return
+            except OSError:
+                pass  # Not supported here; copy instead
+
+        shutil.copyfile(self._input_path, output_path)
+
+    def __enter__(self) -> 'EpubHandler':
+        """Use the handler as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Release the input file, even when the block raised."""
+        self.close()
+
+    def close(self) -> None:
+        """Release the input file."""
+        if getattr(self, '_mmap', None) is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
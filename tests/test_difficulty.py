@@ -0,0 +1,55 @@
+"""Regression checks for suffix-stripping in DifficultyEvaluator."""
+
+import unittest
+
+from src.difficulty import DifficultyEvaluator
+
+
+class CandidateLemmaTest(unittest.TestCase):
+    """Plain words must not borrow the frequency of a look-alike stem."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.evaluator = DifficultyEvaluator(threshold=3.5)
+
+    def test_plain_words_are_not_stripped_to_common_stems(self):
+        # word -> stem it was wrongly reduced to
+        cases = {
+            'herring': 'her',
+            'patter': 'pat',
+            'adder': 'add',
+            'ponder': 'pond',
+            'pudding': 'pud',
+            'bladder': 'blad',
+            'manes': 'man',
+            'tomes': 'tom',
+            'vanes': 'van',
+            'doted': 'dot',
+            'mores': 'more',
+        }
+        for word, stem in cases.items():
+            with self.subTest(word=word):
+                self.assertNotIn(stem, self.evaluator._candidate_lemmas(word))
+
+    def test_rare_plain_words_stay_difficult(self):
+        for word in ('herring', 'patter', 'adder', 'ponder',
+                     'manes', 'tomes', 'vanes', 'doted', 'mores'):
+            with self.subTest(word=word):
+                self.assertTrue(self.evaluator.is_difficult(word))
+
+    def test_rare_plain_words_stay_difficult_at_higher_threshold(self):
+        evaluator = DifficultyEvaluator(threshold=4.0)
+        for word in ('pudding', 'bladder'):
+            with self.subTest(word=word):
+                self.assertTrue(evaluator.is_difficult(word))
+
+    def test_inflections_of_common_words_are_not_difficult(self):
+        for word in ('hugged', 'fanned', 'stopped', 'sadder', 'hotter',
+                     'calmer', 'wiser', 'studied', 'hoped', 'boxes',
+                     'churches', 'glimpsing'):
+            with self.subTest(word=word):
+                self.assertFalse(self.evaluator.is_difficult(word))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Checks for chapter selection in EpubHandler."""
+
+import os
+import tempfile
+import unittest
+
+import ebooklib
+from ebooklib import epub
+
+from src.epub_handler import EpubHandler
+
+
+def _build_book() -> epub.EpubBook:
+    """Build a book holding one item of each kind get_items() can return."""
+    book = epub.EpubBook()
+    book.set_identifier('test-book')
+    book.set_title('Test Book')
+    book.set_language('en')
+
+    chapter = epub.EpubHtml(title='Chapter', file_name='chapter.xhtml', lang='en')
+    chapter.content = '<html><body><p>Chapter text.</p></body></html>'
+    cover = epub.EpubCoverHtml(image_name='cover.png')
+    cover.content = '<html><body><img src="cover.png"/></body></html>'
+    style = epub.EpubItem(
+        uid='style', file_name='style.css', media_type='text/css',
+        content=b'p { margin: 0; }',
+    )
+    image = epub.EpubImage(
+        uid='cover-image', file_name='cover.png', media_type='image/png',
+        content=b'\x89PNG\r\n\x1a\n',
+    )
+    # Named like a chapter, but a plain item guesses its type from the name
+    plain = epub.EpubItem(
+        uid='plain', file_name='plain.xhtml',
+        content=b'<html><body><p>Plain.</p></body></html>',
+    )
+
+    for item in (chapter, cover, style, image, plain, epub.EpubNav()):
+        book.add_item(item)
+    book.toc = [chapter]
+    book.spine = ['nav', chapter]
+    return book
+
+
+class HtmlItemFilterTest(unittest.TestCase):
+    """The isinstance filter must pick the same items as get_type()."""
+
+    def assertSameDocuments(self, items):
+        by_class = [item for item in items if isinstance(item, epub.EpubHtml)]
+        by_type = [
+            item for item in items
+            if item.get_type() == ebooklib.ITEM_DOCUMENT
+        ]
+        self.assertEqual(by_class, by_type)
+        return by_class
+
+    def test_filters_agree_on_built_book(self):
+        items = list(_build_book().get_items())
+        self.assertEqual(len(items), 6)
+        documents = self.assertSameDocuments(items)
+        # Chapter, cover page and navigation document
+        self.assertEqual(len(documents), 3)
+
+    def test_get_html_items_matches_item_document(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'book.epub')
+            epub.write_epub(path, _build_book())
+
+            handler = EpubHandler(path)
+            try:
+                items = list(handler.book.get_items())
+                self.assertSameDocuments(items)
+                self.assertEqual(
+                    handler.get_html_items(),
+                    [item for item in items
+                     if item.get_type() == ebooklib.ITEM_DOCUMENT],
+                )
+            finally:
+                handler.close()
+
+
+if __name__ == '__main__':
+    unittest.main()